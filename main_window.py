@@ -5,10 +5,27 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
                             QSplitter, QMenu, QMenuBar, QStatusBar, QToolBar,
                             QSpinBox, QComboBox, QGroupBox)
 from PyQt6.QtGui import QPixmap, QImage, QAction, QIcon
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
 from pdf_core import PDFCore
 from ocr_integration import OCRIntegration
 
+class TaskThread(QThread):
+    """Run task(progress_callback) off the GUI thread"""
+    progress = pyqtSignal(str)
+
+    def __init__(self, task, parent=None):
+        super().__init__(parent)
+        self.task = task
+        self.result = None
+
+    def run(self):
+        # An exception escaping run() would abort the application
+        try:
+            self.result = self.task(self.progress.emit)
+        except Exception as e:
+            print(f"Error in background task: {e}")
+            self.result = None
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -21,6 +38,10 @@ class MainWindow(QMainWindow):
         self.current_page_num = 0
         self.total_pages = 0
         self.zoom_level = 1.0
+        self.task_thread = None
+        # Menu/toolbar actions that must not run while a task is in progress
+        self.open_actions = []
+        self.save_actions = []
 
         self.init_ui()
         self.create_menu_bar()
@@ -108,6 +129,10 @@ class MainWindow(QMainWindow):
         self.delete_pages_button.clicked.connect(self.delete_pages_dialog)
         page_ops_layout.addWidget(self.delete_pages_button)
 
+        self.split_pdf_button = QPushButton("Split PDF")
+        self.split_pdf_button.clicked.connect(self.split_pdf_dialog)
+        page_ops_layout.addWidget(self.split_pdf_button)
+
         page_ops_group.setLayout(page_ops_layout)
         self.control_panel.addWidget(page_ops_group)
 
@@ -123,6 +148,10 @@ class MainWindow(QMainWindow):
         self.ocr_all_button.clicked.connect(self.create_searchable_pdf)
         ocr_layout.addWidget(self.ocr_all_button)
 
+        self.export_text_button = QPushButton("Export Text...")
+        self.export_text_button.clicked.connect(self.export_text_dialog)
+        ocr_layout.addWidget(self.export_text_button)
+
         ocr_group.setLayout(ocr_layout)
         self.control_panel.addWidget(ocr_group)
 
@@ -169,16 +198,19 @@ class MainWindow(QMainWindow):
         open_action.setShortcut("Ctrl+O")
         open_action.triggered.connect(self.open_pdf_dialog)
         file_menu.addAction(open_action)
+        self.open_actions.append(open_action)
 
         save_action = QAction("Save", self)
         save_action.setShortcut("Ctrl+S")
         save_action.triggered.connect(self.save_pdf_dialog)
         file_menu.addAction(save_action)
+        self.save_actions.append(save_action)
 
         save_as_action = QAction("Save As...", self)
         save_as_action.setShortcut("Ctrl+Shift+S")
         save_as_action.triggered.connect(self.save_pdf_as_dialog)
         file_menu.addAction(save_as_action)
+        self.save_actions.append(save_as_action)
 
         file_menu.addSeparator()
 
@@ -209,8 +241,8 @@ class MainWindow(QMainWindow):
         toolbar = QToolBar("Main Toolbar")
         self.addToolBar(toolbar)
 
-        toolbar.addAction("Open", self.open_pdf_dialog)
-        toolbar.addAction("Save", self.save_pdf_dialog)
+        self.open_actions.append(toolbar.addAction("Open", self.open_pdf_dialog))
+        self.save_actions.append(toolbar.addAction("Save", self.save_pdf_dialog))
         toolbar.addSeparator()
         toolbar.addAction("Previous", self.show_prev_page)
         toolbar.addAction("Next", self.show_next_page)
@@ -224,15 +256,23 @@ class MainWindow(QMainWindow):
 
     def update_ui_state(self):
         is_pdf_open = self.pdf_core.is_pdf_open()
-        self.save_button.setEnabled(is_pdf_open)
-        self.save_as_button.setEnabled(is_pdf_open)
+        is_busy = self.is_task_running()
+        self.open_button.setEnabled(not is_busy)
+        for action in self.open_actions:
+            action.setEnabled(not is_busy)
+        for action in self.save_actions:
+            action.setEnabled(is_pdf_open and not is_busy)
+        self.save_button.setEnabled(is_pdf_open and not is_busy)
+        self.save_as_button.setEnabled(is_pdf_open and not is_busy)
         self.prev_page_button.setEnabled(is_pdf_open and self.current_page_num > 1)
         self.next_page_button.setEnabled(is_pdf_open and self.current_page_num < self.total_pages)
         self.page_spinner.setEnabled(is_pdf_open)
         self.ocr_button.setEnabled(is_pdf_open)
         self.ocr_all_button.setEnabled(is_pdf_open)
-        self.extract_pages_button.setEnabled(is_pdf_open)
-        self.delete_pages_button.setEnabled(is_pdf_open)
+        self.export_text_button.setEnabled(is_pdf_open and not is_busy)
+        self.extract_pages_button.setEnabled(is_pdf_open and not is_busy)
+        self.delete_pages_button.setEnabled(is_pdf_open and not is_busy)
+        self.split_pdf_button.setEnabled(is_pdf_open and not is_busy)
         self.zoom_combo.setEnabled(is_pdf_open)
 
         if is_pdf_open:
@@ -247,6 +287,23 @@ class MainWindow(QMainWindow):
             self.page_spinner.setMaximum(0)
             self.status_bar.showMessage("Ready")
 
+    def is_task_running(self):
+        return self.task_thread is not None
+
+    def start_task(self, task, on_finished):
+        thread = TaskThread(task, self)
+        thread.progress.connect(self.status_bar.showMessage)
+        thread.finished.connect(lambda: self.task_finished(thread, on_finished))
+        self.task_thread = thread
+        thread.start()
+        self.update_ui_state()
+
+    def task_finished(self, thread, on_finished):
+        self.task_thread = None
+        thread.deleteLater()
+        self.update_ui_state()
+        on_finished(thread.result)
+
     def open_pdf_dialog(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open PDF", "", "PDF Files (*.pdf)")
         if file_path:
@@ -382,6 +439,36 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Error", "Failed to create searchable PDF. Make sure ocrmypdf is installed.")
                 self.status_bar.showMessage("Failed to create searchable PDF", 3000)
 
+    def export_text_dialog(self):
+        if not self.pdf_core.is_pdf_open():
+            QMessageBox.warning(self, "Export Text", "No PDF document open.")
+            return
+
+        output_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Text As", "", "JSON Lines (*.jsonl);;Text Files (*.txt)")
+        if output_path:
+            output_format = 'text' if selected_filter.startswith("Text") else 'jsonl'
+            password = self.pdf_core.password
+            total_pages = self.total_pages
+            self.status_bar.showMessage("Exporting text...")
+
+            def task(report):
+                # Export the current document, unsaved changes included, like Split PDF
+                with self.pdf_core.temp_copy() as source_path:
+                    return self.ocr_integration.export_structured_text(
+                        source_path, output_path, output_format, password=password,
+                        progress_callback=lambda page_num: report(f"Exporting text... page {page_num}/{total_pages}"))
+
+            self.start_task(task, self.export_text_finished)
+
+    def export_text_finished(self, success):
+        if success:
+            QMessageBox.information(self, "Export Text", "Text exported successfully.")
+            self.status_bar.showMessage("Text exported", 3000)
+        else:
+            QMessageBox.warning(self, "Export Text", "Failed to export text.")
+            self.status_bar.showMessage("Failed to export text", 3000)
+
     def extract_pages_dialog(self):
         if not self.pdf_core.is_pdf_open():
             QMessageBox.warning(self, "Extract Pages", "No PDF document open.")
@@ -439,6 +526,46 @@ class MainWindow(QMainWindow):
             except ValueError as e:
                 QMessageBox.warning(self, "Invalid Input", str(e))
 
+    def split_pdf_dialog(self):
+        if not self.pdf_core.is_pdf_open():
+            QMessageBox.warning(self, "Split PDF", "No PDF document open.")
+            return
+
+        from PyQt6.QtWidgets import QInputDialog
+        modes = {"By page count": "pages", "By file size (MB)": "size", "By bookmarks": "outline"}
+        mode_text, ok = QInputDialog.getItem(self, "Split PDF", "Split mode:", list(modes.keys()), 0, False)
+        if not ok:
+            return
+        mode = modes[mode_text]
+
+        value = 0
+        if mode == "pages":
+            value, ok = QInputDialog.getInt(self, "Split PDF", "Pages per part:", 10, 1, max(1, self.total_pages))
+        elif mode == "size":
+            size_mb, ok = QInputDialog.getInt(self, "Split PDF", "Target size per part (MB):", 10, 1, 100000)
+            value = size_mb * 1024 * 1024
+        if not ok:
+            return
+
+        output_dir = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        if output_dir:
+            self.status_bar.showMessage("Splitting PDF...")
+
+            def task(report):
+                return self.pdf_core.split_pdf(
+                    output_dir, mode=mode, value=value,
+                    progress_callback=lambda done, total: report(f"Splitting PDF... {done}/{total} parts written"))
+
+            self.start_task(task, self.split_pdf_finished)
+
+    def split_pdf_finished(self, output_paths):
+        if output_paths:
+            QMessageBox.information(self, "Split PDF", f"PDF split into {len(output_paths)} parts.")
+            self.status_bar.showMessage(f"PDF split into {len(output_paths)} parts", 3000)
+        else:
+            QMessageBox.warning(self, "Split PDF", "Failed to split PDF. No parts were kept.")
+            self.status_bar.showMessage("Failed to split PDF", 3000)
+
     def parse_page_range(self, range_str, max_pages):
         pages = set()
         parts = range_str.replace(" ", "").split(',')
@@ -459,7 +586,10 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle application close event"""
-        if self.pdf_core.is_pdf_open():
+        if self.is_task_running():
+            QMessageBox.warning(self, "Exit", "Please wait for the current operation to finish.")
+            event.ignore()
+        elif self.pdf_core.is_pdf_open():
             reply = QMessageBox.question(self, "Exit", 
                                        "Do you want to save changes before closing?",
                                        QMessageBox.StandardButton.Save | 
@@ -3,6 +3,7 @@ from PIL import Image
 import io
 import fitz  # PyMuPDF
 import os
+import json
 import platform
 
 class OCRIntegration:
@@ -56,6 +57,137 @@ class OCRIntegration:
             print(f"Error performing OCR on PDF page: {e}")
             return None
 
+    def iter_structured_text(self, pdf_path, dpi=300, tesseract_lang='eng', min_text_coverage=0.01,
+                             password=None):
+        """Yield one dict per page with words, boxes and confidences.
+
+        Pages whose text-layer words cover less than min_text_coverage of
+        the page area are OCR'd instead, so a stamp or Bates number alone
+        does not stop a scanned page from being OCR'd (0 disables OCR).
+        Boxes are [x0, y0, x1, y1] in points on the page as displayed
+        (rotation applied), with the origin at the top-left. Text-layer
+        words have no confidence (None); OCR words use Tesseract's 0-100
+        score. Each word's block and line numbers are unique within its page.
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            if password:
+                doc.authenticate(password)
+            for page_index in range(len(doc)):
+                page = doc.load_page(page_index)
+                words = self._get_text_layer_words(page)
+                source = "text"
+                if self._get_text_coverage(page, words) < min_text_coverage:
+                    words = self._get_ocr_words(page, dpi, tesseract_lang)
+                    source = "ocr"
+                yield {
+                    "page": page_index + 1,
+                    "width": page.rect.width,
+                    "height": page.rect.height,
+                    "source": source,
+                    "text": self._words_to_text(words),
+                    "words": words,
+                }
+        finally:
+            doc.close()
+
+    def _get_text_coverage(self, page, words):
+        """Fraction of the page area covered by the given words' boxes"""
+        page_area = page.rect.width * page.rect.height
+        if page_area <= 0:
+            return 0
+        text_area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in (word["bbox"] for word in words))
+        return text_area / page_area
+
+    def _get_text_layer_words(self, page):
+        # get_text("words") entries are (x0, y0, x1, y1, text, block, line, word)
+        # in unrotated coordinates; map them onto the displayed page
+        line_ids = {}
+        words = []
+        for w in page.get_text("words"):
+            if not w[4].strip():
+                continue
+            rect = fitz.Rect(w[:4]) * page.rotation_matrix
+            words.append({
+                "text": w[4],
+                "bbox": [round(c, 2) for c in rect],
+                "confidence": None,
+                "block": w[5],
+                "line": line_ids.setdefault((w[5], w[6]), len(line_ids)),
+            })
+        return words
+
+    def _get_ocr_words(self, page, dpi, tesseract_lang):
+        pix = page.get_pixmap(matrix=fitz.Matrix(dpi / 72, dpi / 72))
+        image = Image.open(io.BytesIO(pix.tobytes("png")))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        data = pytesseract.image_to_data(image, lang=tesseract_lang,
+                                         output_type=pytesseract.Output.DICT)
+        scale = 72 / dpi  # image pixels -> points
+        line_ids = {}
+        words = []
+        for i, text in enumerate(data["text"]):
+            confidence = float(data["conf"][i])
+            # Non-word rows (blocks, lines, paragraphs) have conf -1
+            if confidence < 0 or not text.strip():
+                continue
+            left, top = data["left"][i], data["top"][i]
+            right, bottom = left + data["width"][i], top + data["height"][i]
+            # line_num restarts in every paragraph
+            line_key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            words.append({
+                "text": text,
+                "bbox": [round(left * scale, 2), round(top * scale, 2),
+                         round(right * scale, 2), round(bottom * scale, 2)],
+                "confidence": confidence,
+                "block": data["block_num"][i],
+                "line": line_ids.setdefault(line_key, len(line_ids)),
+            })
+        return words
+
+    def _words_to_text(self, words):
+        """Join words into lines, with a blank line between blocks"""
+        lines = []
+        previous = None
+        for word in words:
+            if previous and word["line"] == previous["line"]:
+                lines[-1] += " " + word["text"]
+                continue
+            if previous and word["block"] != previous["block"]:
+                lines.append("")
+            lines.append(word["text"])
+            previous = word
+        return "\n".join(lines)
+
+    def export_structured_text(self, pdf_path, output_path, output_format='jsonl',
+                               progress_callback=None, **kwargs):
+        """Stream the document's text to output_path as JSONL or plain text.
+
+        output_format is 'jsonl' or 'text'; plain text pages are separated
+        by form feeds. progress_callback(page_number) is called after each
+        page is written. Extra keyword arguments (password,
+        min_text_coverage, dpi, ...) are passed to iter_structured_text.
+        On failure the partial output file is removed.
+        """
+        if output_format not in ('jsonl', 'text'):
+            raise ValueError(f"Unknown output format: {output_format}")
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                for page in self.iter_structured_text(pdf_path, **kwargs):
+                    if output_format == 'jsonl':
+                        f.write(json.dumps(page, ensure_ascii=False) + "\n")
+                    else:
+                        f.write(page["text"] + "\n\f")
+                    if progress_callback:
+                        progress_callback(page["page"])
+            return True
+        except Exception as e:
+            print(f"Error exporting structured text: {e}")
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            return False
+
     def create_searchable_pdf(self, input_pdf_path, output_pdf_path, tesseract_lang='eng'):
         """Create a searchable PDF with OCR text layer"""
         try:
@@ -1,16 +1,51 @@
 import pikepdf
 import fitz  # PyMuPDF
 import io
+import os
+import shutil
+import tempfile
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Source document opened once per split worker process (see _init_split_worker)
+_split_source = None
+
+
+def _init_split_worker(file_path, password):
+    global _split_source
+    _split_source = pikepdf.open(file_path, password=password or "")
+
+
+def _write_split_chunk(page_indices, output_path):
+    """Write the given 0-indexed pages of the worker's source to output_path"""
+    chunk_pdf = pikepdf.new()
+    try:
+        for index in page_indices:
+            chunk_pdf.pages.append(_split_source.pages[index])
+        # Drop inherited resources the chunk's content streams never use
+        chunk_pdf.remove_unreferenced_resources()
+        chunk_pdf.save(output_path)
+    except Exception:
+        # Don't leave a truncated part behind
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+    finally:
+        chunk_pdf.close()
+    return output_path
 
 class PDFCore:
     def __init__(self):
         self.pdf_document = None
         self.file_path = None
+        self.password = None
 
     def open_pdf(self, file_path, password=None):
         try:
             self.pdf_document = pikepdf.open(file_path, password=password)
             self.file_path = file_path
+            self.password = password
             return True
         except pikepdf.PasswordError:
             print("Incorrect password.")
@@ -38,6 +73,7 @@ class PDFCore:
             self.pdf_document.close()
             self.pdf_document = None
             self.file_path = None
+            self.password = None
 
     def extract_pages(self, page_numbers, output_path):
         if not self.pdf_document:
@@ -56,6 +92,117 @@ class PDFCore:
             print(f"Error extracting pages: {e}")
             return False
 
+    def split_pdf(self, output_dir, mode="pages", value=10, max_workers=None, progress_callback=None):
+        """Split the current document into chunks written in parallel.
+
+        mode is "pages" (value = pages per chunk), "size" (value = target
+        chunk size in bytes, estimated from the average page size) or
+        "outline" (split at top-level bookmarks, value is ignored).
+        The document is first saved to a temporary file so unsaved changes
+        are included. progress_callback(done, total) is called as each part
+        is written. Returns the list of written paths; on failure any parts
+        already written are removed.
+        """
+        if not self.pdf_document:
+            print("No PDF document open.")
+            return None
+        if not self.file_path:
+            print("Cannot split: PDF not opened from a file path.")
+            return None
+
+        # Copy these up front; opening another file mid-split must not affect us
+        file_path, password = self.file_path, self.password
+        futures = {}
+        try:
+            with self.temp_copy() as source_path:
+                with pikepdf.open(source_path, password=password or "") as source:
+                    num_pages = len(source.pages)
+
+                chunks = self._get_split_chunks(source_path, num_pages, mode, value, password)
+                if not chunks:
+                    print("No pages to split.")
+                    return None
+
+                os.makedirs(output_dir, exist_ok=True)
+                base_name = os.path.splitext(os.path.basename(file_path))[0]
+                width = max(3, len(str(len(chunks))))
+                output_paths = [
+                    os.path.join(output_dir, f"{base_name}_part{i:0{width}d}.pdf")
+                    for i in range(1, len(chunks) + 1)
+                ]
+
+                # Forking a threaded (Qt) process can deadlock the children
+                with ProcessPoolExecutor(max_workers=max_workers,
+                                         mp_context=multiprocessing.get_context("spawn"),
+                                         initializer=_init_split_worker,
+                                         initargs=(source_path, password)) as executor:
+                    futures = {executor.submit(_write_split_chunk, chunk, path): path
+                               for chunk, path in zip(chunks, output_paths)}
+                    try:
+                        for done, future in enumerate(as_completed(futures), start=1):
+                            future.result()
+                            if progress_callback:
+                                progress_callback(done, len(chunks))
+                    except Exception:
+                        for future in futures:
+                            future.cancel()
+                        raise
+                return output_paths
+        except Exception as e:
+            print(f"Error splitting PDF: {e}")
+            # Parts still running when the error hit have finished by now
+            for future, path in futures.items():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    try:
+                        os.remove(path)
+                    except OSError as remove_error:
+                        print(f"Could not remove partial output {path}: {remove_error}")
+            return None
+
+    @contextmanager
+    def temp_copy(self):
+        """Save the current document, unsaved changes included, to a temporary file.
+
+        Yields the file's path; the file is deleted on exit. Existing
+        encryption is kept, so open it with self.password.
+        """
+        temp_dir = tempfile.mkdtemp(prefix="pdf_editor_")
+        try:
+            temp_path = os.path.join(temp_dir, "source.pdf")
+            self.pdf_document.save(temp_path, encryption=self.pdf_document.is_encrypted)
+            yield temp_path
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _get_split_chunks(self, source_path, num_pages, mode, value, password):
+        if mode == "pages":
+            pages_per_chunk = max(1, int(value))
+        elif mode == "size":
+            avg_page_size = os.path.getsize(source_path) / max(1, num_pages)
+            pages_per_chunk = max(1, int(value // max(1, avg_page_size)))
+        elif mode == "outline":
+            starts = self._get_outline_page_starts(source_path, password)
+            if not starts:
+                print("No bookmarks found; splitting into a single chunk.")
+            boundaries = sorted(set([0] + starts)) + [num_pages]
+            return [list(range(start, end)) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+        else:
+            raise ValueError(f"Unknown split mode: {mode}")
+        return [list(range(start, min(start + pages_per_chunk, num_pages)))
+                for start in range(0, num_pages, pages_per_chunk)]
+
+    def _get_outline_page_starts(self, source_path, password):
+        """Return 0-indexed start pages of the top-level bookmarks"""
+        doc = fitz.open(source_path)
+        try:
+            if password:
+                doc.authenticate(password)
+            # get_toc entries are [level, title, 1-based page]; page is -1 if unresolved
+            return [entry[2] - 1 for entry in doc.get_toc(simple=True)
+                    if entry[0] == 1 and 1 <= entry[2] <= len(doc)]
+        finally:
+            doc.close()
+
     def delete_pages(self, page_numbers):
         if not self.pdf_document:
             print("No PDF document open.")